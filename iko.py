@@ -3,25 +3,229 @@
 
 import tkinter as tk
 import customtkinter as ctk
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
+import functools
 import math
 import random
-from collections import deque
+import time
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba необязателен: без него вычислительные ядра выполняются интерпретатором
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Перевод градусов в радианы и обратно
+DEG = math.pi / 180.0
+RAD = 180.0 / math.pi
+
+# Таблицы синусов/косинусов пеленга с шагом 0.1° для пакетного пересчета координат
+BEARING_TABLE_STEPS = 3600
+_bearing_table_rad = np.radians(np.arange(BEARING_TABLE_STEPS) * (360.0 / BEARING_TABLE_STEPS))
+SIN_TABLE = np.sin(_bearing_table_rad)
+COS_TABLE = np.cos(_bearing_table_rad)
+
+# Число уровней интенсивности помех, для которых кэшируются кадры фона
+CLUTTER_LEVELS = 10
+
+# Цвета отметок помех (желтый оттенок) по значению яркости 0..255
+CLUTTER_FILLS = tuple((c, c, 0) for c in range(256))
+
+# Двузначная шестнадцатеричная запись байта для сборки цветов '#rrggbb' без форматирования
+HEX_BYTE = tuple(f'{i:02x}' for i in range(256))
+
+# Цвета отметки цели по значению яркости 0..255: точка, ореол и внешний ореол
+TARGET_MAIN_COLORS = tuple('#' + HEX_BYTE[v] + HEX_BYTE[v] + '00' for v in range(256))
+TARGET_HALO_COLORS = tuple('#' + HEX_BYTE[min(255, v+50)] + HEX_BYTE[min(255, v+30)] + '00'
+                           for v in range(256))
+TARGET_OUTER_COLORS = tuple('#' + HEX_BYTE[min(255, v+20)] + HEX_BYTE[min(255, v+10)] + '00'
+                            for v in range(256))
+
+def coastline_glow_layers():
+    """Ширина и цвет слоев свечения береговой линии"""
+    layers = []
+    for i in range(1, 4):
+        shade = int(200 - i*30)
+        shade = max(40, shade)
+        layers.append((2 + i, f'#{shade:02x}{int(shade*0.85):02x}30'))
+    return tuple(layers)
+
+COASTLINE_GLOW = coastline_glow_layers()
+
+@functools.lru_cache(maxsize=None)
+def trail_point_fades(count):
+    """Затухание и цвета точек следа из count точек (от новой к старой)"""
+    fades = np.linspace(1.0, 0.4, count)
+    reds = (100 + 155 * (1 - fades)).astype(np.int32)
+    greens = (200 + 55 * fades).astype(np.int32)
+    blues = (50 * (1 - fades)).astype(np.int32)
+    colors = tuple('#' + HEX_BYTE[r] + HEX_BYTE[g] + HEX_BYTE[b]
+                   for r, g, b in zip(reds.tolist(), greens.tolist(), blues.tolist()))
+    return fades, colors
+
+@functools.lru_cache(maxsize=256)
+def target_sprite(core_r, val, has_outer):
+    """Изображение отметки цели: точка, ореол и, при has_outer, внешний ореол"""
+    halo_radius = core_r + 2
+    outer_radius = halo_radius + 3
+    c = outer_radius + 1
+    img = Image.new('RGBA', (2 * c + 1, 2 * c + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    main_color = TARGET_MAIN_COLORS[val]
+    draw.ellipse((c - core_r, c - core_r, c + core_r, c + core_r), fill=main_color, outline=main_color)
+    halo_color = TARGET_HALO_COLORS[val]
+    draw.ellipse((c - halo_radius, c - halo_radius, c + halo_radius, c + halo_radius),
+                 outline=halo_color, width=1)
+    if has_outer:
+        outer_color = TARGET_OUTER_COLORS[val]
+        draw.ellipse((c - outer_radius, c - outer_radius, c + outer_radius, c + outer_radius),
+                     outline=outer_color, width=1)
+    return ImageTk.PhotoImage(img)
+
+# ---------------- ВЫЧИСЛИТЕЛЬНЫЕ ЯДРА ----------------
+@njit(cache=True, fastmath=True)
+def polar_to_xy_kernel(bearings, ranges, cx, cy, px_per_mile):
+    """Экранные координаты точек через таблицы sin/cos, поочередно x0, y0, x1, y1, ..."""
+    n = bearings.shape[0]
+    xy = np.empty(2 * n)
+    steps_per_degree = BEARING_TABLE_STEPS / 360.0
+    for i in range(n):
+        k = int(round(bearings[i] * steps_per_degree)) % BEARING_TABLE_STEPS
+        scale = ranges[i] * px_per_mile
+        xy[2 * i] = cx + scale * SIN_TABLE[k]
+        xy[2 * i + 1] = cy - scale * COS_TABLE[k]
+    return xy
+
+def polar_to_xy(bearings, ranges, cx, cy, px_per_mile):
+    """
+    Пакетное преобразование полярных координат в экранные (x, y поочередно).
+    С Numba работает скомпилированное ядро, без него - векторный расчет NumPy.
+    """
+    if HAVE_NUMBA:
+        # Один тип входных массивов - одна компиляция ядра: следы приходят срезами
+        # float32 (в том числе обратными), берег и помехи - массивами float64
+        return polar_to_xy_kernel(np.ascontiguousarray(bearings, dtype=np.float64),
+                                  np.ascontiguousarray(ranges, dtype=np.float64),
+                                  float(cx), float(cy), float(px_per_mile))
+    idx = np.rint(np.asarray(bearings) * (BEARING_TABLE_STEPS / 360.0)).astype(np.int32) % BEARING_TABLE_STEPS
+    scale = np.asarray(ranges) * px_per_mile
+    xy = np.empty(2 * len(idx))
+    # Пеленг отсчитывается от севера по часовой стрелке: x ~ sin, y ~ cos
+    xy[0::2] = cx + scale * SIN_TABLE[idx]
+    xy[1::2] = cy - scale * COS_TABLE[idx]
+    return xy
+
+@njit(cache=True, fastmath=True)
+def epr_kernel(length, width, height_above_water, material_factor, aspect_angle):
+    """ЭПР по размерам цели и уже найденному коэффициенту материала"""
+    base_epr = (length * width * max(0.1, height_above_water)) ** (2/3)
+    aspect_factor = abs(math.sin(math.radians(aspect_angle)))
+    form_factor = 0.7
+    final_epr = base_epr * material_factor * (0.3 + 0.7 * aspect_factor) * form_factor
+    return max(final_epr, 0.001)
+
+@njit(cache=True, fastmath=True)
+def angular_width_kernel(length, width, aspect_angle, range_mi):
+    """Угловой размер отметки цели в градусах"""
+    L = max(0.1, length)
+    B = max(0.1, width)
+    a_rad = math.radians(aspect_angle)
+    projected_m = L * abs(math.sin(a_rad)) + B * abs(math.cos(a_rad))
+    distance_m = max(1.0, range_mi * 1852.0)
+    # сжатие до реалистичной отметки радара
+    angular_deg = math.degrees(projected_m / distance_m) * 0.3
+    return max(0.18, min(3.5, angular_deg))
+
+@njit(cache=True, fastmath=True)
+def target_brightness_kernel(epr, aspect_angle, range_mi, range_scale):
+    """Яркость отметки цели в диапазоне 0.05..1.0"""
+    epr_factor = math.log10(max(0.01, epr) + 1)
+    aspect = max(0.0, min(1.0, abs(math.sin(math.radians(aspect_angle)))))
+    range_factor = max(0.12, 1.0 - (range_mi / range_scale) * 0.6)
+    base = 0.12
+    brightness = base + epr_factor * aspect * range_factor * 1.5
+    return max(0.05, min(1.0, brightness))
+
+# Коэффициенты отражения материалов (ключи в нижнем регистре)
+MATERIAL_FACTORS = {
+    "металл": 1.0, "сталь": 0.95, "алюминий": 0.9, "железо": 0.92,
+    "пластик": 0.1, "стеклопластик": 0.08, "дерево": 0.05, "резина": 0.03, "композит": 0.07
+}
 
 class EPRCalculator:
+    @staticmethod
+    def material_factor(material):
+        """Коэффициент материала; название приводится к нижнему регистру только при промахе"""
+        factor = MATERIAL_FACTORS.get(material)
+        if factor is None:
+            factor = MATERIAL_FACTORS.get(material.lower(), 0.1)
+        return factor
+
     @staticmethod
     def calculate_epr_from_dimensions(length, width, height_above_water, material, aspect_angle):
         """Расчет ЭПР цели на основе физических размеров и материала"""
-        base_epr = (length * width * max(0.1, height_above_water)) ** (2/3)
-        material_coefficients = {
-            "металл": 1.0, "сталь": 0.95, "алюминий": 0.9, "железо": 0.92,
-            "пластик": 0.1, "стеклопластик": 0.08, "дерево": 0.05, "резина": 0.03, "композит": 0.07
-        }
-        material_factor = material_coefficients.get(material.lower(), 0.1)
-        aspect_rad = math.radians(aspect_angle)
-        aspect_factor = abs(math.sin(aspect_rad))
-        form_factor = 0.7
-        final_epr = base_epr * material_factor * (0.3 + 0.7 * aspect_factor) * form_factor
-        return max(final_epr, 0.001)
+        material_factor = EPRCalculator.material_factor(material)
+        return epr_kernel(length, width, height_above_water, material_factor, aspect_angle)
+
+class TargetHistory:
+    """Кольцевой буфер истории цели: пеленг, дальность и ЭПР в отдельных массивах"""
+    def __init__(self, capacity):
+        self.capacity = max(0, int(capacity))
+        self.bearings = np.zeros(self.capacity, dtype=np.float32)
+        self.ranges = np.zeros(self.capacity, dtype=np.float32)
+        self.eprs = np.zeros(self.capacity, dtype=np.float32)
+        self.head = 0   # индекс следующей записи
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, bearing, range_val, epr):
+        """Запись новой точки поверх самой старой"""
+        if self.capacity == 0:
+            return
+        self.bearings[self.head] = bearing
+        self.ranges[self.head] = range_val
+        self.eprs[self.head] = epr
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def snapshot(self):
+        """Массивы пеленгов, дальностей и ЭПР в порядке от новой точки к старой"""
+        if self.count == 0:
+            return self.bearings[:0], self.ranges[:0], self.eprs[:0]
+        head = self.head
+        if self.count < self.capacity or head == 0:
+            # Буфер не перевернулся (или новейшая точка в конце): достаточно обратного среза
+            end = head or self.capacity
+            return (self.bearings[end - 1::-1], self.ranges[end - 1::-1],
+                    self.eprs[end - 1::-1])
+        # Две части: [head-1..0] и [capacity-1..head]
+        return tuple(np.concatenate((arr[head - 1::-1], arr[:head - 1:-1]))
+                     for arr in (self.bearings, self.ranges, self.eprs))
+
+    def resize(self, capacity):
+        """Изменение емкости на месте с сохранением самых свежих точек"""
+        capacity = max(0, int(capacity))
+        if capacity == self.capacity:
+            return
+        keep = min(self.count, capacity)
+        # Самые свежие точки переписываются в начало новых массивов от старой к новой
+        columns = [arr[:keep][::-1] for arr in self.snapshot()]
+        for name, column in zip(('bearings', 'ranges', 'eprs'), columns):
+            arr = np.zeros(capacity, dtype=np.float32)
+            arr[:keep] = column
+            setattr(self, name, arr)
+        self.capacity = capacity
+        self.count = keep
+        self.head = keep % capacity if capacity else 0
 
 class CollapsibleFrame(ctk.CTkFrame):
     """Сворачиваемый фрейм с заголовком"""
@@ -84,22 +288,32 @@ class ИКО:
         self.target_length = 30.0  # метры
         self.target_width = 7.0    # метры
 
+        # Генератор случайных чисел NumPy (PCG64) для помех
+        self.rng = np.random.default_rng()
+
         # Помехи и следы
         self.clutter_intensity = 0.45
         self.clutter_density = 140
-        self.target_history = deque(maxlen=30)
+        self.clutter_seed = int(self.rng.integers(2**32))
+        self.target_history = TargetHistory(30)
+        self.last_hist_bearing = math.nan  # последняя принятая в историю позиция
+        self.last_hist_range = math.nan
         self.show_trails = True
         self.trail_length = 30
+        self.trail_fade_groups = 3
 
         # Береговая линия
         self.coastline_points = self.generate_coastline()
         self.show_coastline = True
+        self.coast_cache = None
 
         # Имитация движения цели
         self.target_moving = False
         self.target_course = 45.0  # градусы
         self.target_speed = 10.0   # узлов
         self.simulation_interval = 500  # мс
+        self.movement_after_id = None
+        self.last_tick_time = 0.0  # момент предыдущего шага по time.monotonic()
 
         # Формуляр цели
         self.show_target_form = False
@@ -110,8 +324,50 @@ class ИКО:
         # Сворачивание панели управления
         self.control_panel_visible = True
 
-        # Флаг изменения размера
+        # Флаг изменения размера и кэш геометрии шкал
         self.updating_size = False
+        self.resize_after_id = None
+        self.resize_delay = 80  # мс
+        self.container_size = None  # последний размер контейнера холста из <Configure>
+
+        # Отложенная перерисовка по событиям слайдеров
+        self.redraw_after_id = None
+        self.redraw_full = False
+        self.redraw_dynamic = False  # нужна ли перерисовка слоев цели (иначе только метки)
+        self.redraw_background = False  # нужна ли смена кадра фона по уровню помех
+        self.redraw_interval = 50  # мс
+        self.last_redraw_time = 0.0
+        # Тексты меток значений, ожидающие применения, и последние примененные тексты
+        self.pending_labels = {}
+        self.label_texts = {}
+        self.geometry_key = None
+        self.ring_geom = []
+        self.bearing_geom = []
+
+        # Растровый фон: подслои, собранный кадр и его элемент на холсте
+        self.grid_layer = None
+        self.frame_img = None
+        self.background_photo = None
+        self.background_key = None
+        self.background_level = None  # уровень помех кадра, показанного на холсте
+        self.background_cache = {}
+        self.background_item = None
+        self.clutter_cells_cache = None  # (ключ, выборки помех)
+
+        # Постоянные элементы холста для отметки цели, курсора и формуляра
+        self.target_item = None
+        self.target_sprite = None
+        self.target_hidden = False
+        self.target_xy_key = None  # позиция и масштаб, для которых посчитаны target_xy
+        self.target_xy = None
+        self.trail_line_items = []   # пул отрезков следа, по одному на возрастную группу
+        self.trail_point_items = []  # пул точек следа
+        self.trail_line_count = 0    # сколько элементов пула сейчас видно
+        self.trail_point_count = 0
+        self.cursor_items = None
+        self.form_rect = None
+        self.form_text_items = None
+        self.form_texts = []
 
         # Построение интерфейса
         self.setup_ui()
@@ -390,32 +646,99 @@ class ИКО:
     # ---------------- ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ----------------
     def polar_to_cartesian(self, bearing, range_val):
         """Преобразование полярных координат в декартовы"""
-        angle_rad = math.radians(90 - bearing)
-        x = self.center + range_val * self.pixel_per_mile * math.cos(angle_rad)
-        y = self.center - range_val * self.pixel_per_mile * math.sin(angle_rad)
+        # cos(90° - b) = sin(b), sin(90° - b) = cos(b)
+        bearing_rad = bearing * DEG
+        scale = range_val * self.pixel_per_mile
+        x = self.center + scale * math.sin(bearing_rad)
+        y = self.center - scale * math.cos(bearing_rad)
         return x, y
 
+    def target_position(self):
+        """Экранные координаты цели; пересчитываются только при изменении позиции или масштаба"""
+        key = (self.target_bearing, self.target_range, self.center, self.pixel_per_mile)
+        if key != self.target_xy_key:
+            self.target_xy_key = key
+            self.target_xy = self.polar_to_cartesian(self.target_bearing, self.target_range)
+        return self.target_xy
+
+    def polar_to_xy_batch(self, bearings, ranges):
+        """Пакетное преобразование полярных координат в декартовы по таблицам sin/cos"""
+        return polar_to_xy(bearings, ranges, float(self.center), float(self.center), self.pixel_per_mile)
+
     # ---------------- ОТРИСОВКА РАДАРА ----------------
     def draw_radar_display(self):
         """Основная функция отрисовки радарного дисплея"""
         if not hasattr(self, 'canvas'):
             return
-        self.canvas.delete("all")
+        self.draw_static_layers()
+        self.draw_dynamic_layers()
+
+    def draw_static_layers(self):
+        """Отрисовка слоев, не зависящих от цели (фон с помехами, кольца, метки, берег)"""
         self.update_canvas_size()
-        self.draw_grid_background()
+        self.canvas.delete("static")
+        self.draw_background()
         self.draw_range_rings()
         self.draw_bearing_marks()
-        self.draw_sea_clutter()
         if self.show_coastline:
             self.draw_coastline()
-        if self.show_trails:
+        # Статические слои всегда лежат под отметками цели, растровый фон - под ними
+        self.canvas.tag_lower("static")
+        self.canvas.tag_lower(self.background_item)
+
+    def draw_background(self):
+        """Вывод растрового фона (сетка и морские помехи) одним элементом холста"""
+        # Кадры фона кэшируются по уровням интенсивности помех, пока не изменятся
+        # размер холста или входные данные выборок помех (зерно, шкала, плотность)
+        key = (self.canvas_size, self.clutter_seed, self.range_scale, self.clutter_density)
+        if key != self.background_key:
+            self.background_key = key
+            self.background_cache = {}
+            self.background_level = None
+        level = int(round(self.clutter_intensity * CLUTTER_LEVELS))
+        if level == self.background_level:
+            return
+        self.background_level = level
+        photo = self.background_cache.get(level)
+        if photo is None:
+            photo = self.compose_background(level / CLUTTER_LEVELS)
+            self.background_cache[level] = photo
+        self.background_photo = photo
+        if self.background_item is None:
+            self.background_item = self.canvas.create_image(0, 0, anchor='nw', image=self.background_photo)
+        else:
+            self.canvas.itemconfigure(self.background_item, image=self.background_photo)
+
+    def compose_background(self, intensity):
+        """Сборка кадра фона из подслоя сетки и помех заданной интенсивности"""
+        size = self.canvas_size
+        if self.frame_img is None or self.frame_img.size != (size, size):
+            self.frame_img = Image.new('RGB', (size, size))
+        self.frame_img.paste(self.draw_grid_background(), (0, 0))
+        # Отметки помех непрозрачны: они рисуются прямо в кадр, без отдельного слоя
+        if intensity > 0.01:
+            self.draw_sea_clutter(intensity, self.frame_img)
+        return ImageTk.PhotoImage(self.frame_img, master=self.canvas)
+
+    def draw_dynamic_layers(self):
+        """Отрисовка слоев цели: следы, отметка, курсор и формуляр"""
+        if not hasattr(self, 'canvas'):
+            return
+        self.flush_label_updates()
+        if self.show_trails and len(self.target_history) >= 2:
             self.draw_target_trails()
+        else:
+            self.hide_target_trails()
         self.draw_current_target()
         
-        # Отрисовка курсора и формуляра цели
-        if self.show_target_form:
+        # Отрисовка курсора и формуляра цели (постоянные элементы скрываются, а не удаляются);
+        # вместе с отметкой они скрываются и для цели за пределами развертки
+        if self.show_target_form and self.target_range < self.range_scale:
             self.draw_target_cursor()
             self.draw_target_form()
+        else:
+            self.canvas.itemconfigure("cursor", state='hidden')
+            self.canvas.itemconfigure("form", state='hidden')
             
         self.update_target_info()
 
@@ -434,155 +757,244 @@ class ИКО:
                 self.canvas.config(width=self.canvas_size, height=self.canvas_size)
             self.center = self.canvas_size // 2
             self.pixel_per_mile = max(1.0, (self.canvas_size // 2 - 40) / self.range_scale)
+            geometry_key = (self.canvas_size, self.range_scale)
+            if geometry_key != self.geometry_key:
+                self.geometry_key = geometry_key
+                self.coast_cache = None
+                self.update_scale_geometry()
         finally:
             self.updating_size = False
 
+    def update_scale_geometry(self):
+        """Предварительный расчет координат колец дальности и меток пеленга"""
+        num_rings = 4
+        self.ring_geom = []
+        for i in range(1, num_rings + 1):
+            range_val = (self.range_scale / num_rings) * i
+            radius = range_val * self.pixel_per_mile
+            x, y = self.polar_to_cartesian(0, range_val)
+            self.ring_geom.append((self.center - radius, self.center - radius,
+                                   self.center + radius, self.center + radius,
+                                   x + 8, y - 8, f"{int(range_val)}"))
+        self.bearing_geom = []
+        for bearing in range(0, 360, 30):
+            x1, y1 = self.polar_to_cartesian(bearing, self.range_scale * 0.92)
+            x2, y2 = self.polar_to_cartesian(bearing, self.range_scale)
+            x_text, y_text = self.polar_to_cartesian(bearing, self.range_scale * 1.03)
+            self.bearing_geom.append((x1, y1, x2, y2, x_text, y_text, f"{bearing}°"))
+
     def draw_grid_background(self):
-        """Отрисовка сетки фона"""
+        """Подслой сетки фона (кэшируется до изменения размера холста)"""
         w = self.canvas_size
+        if self.grid_layer is not None and self.grid_layer.size == (w, w):
+            return self.grid_layer
+        img = Image.new('RGB', (w, w), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
         step = max(20, w // 12)
         for i in range(0, w, step):
             r = i // 2
             if r <= 0: continue
             shade = 12 + (i // max(1, step)) * 3
             shade = min(80, shade)
-            color = f'#{shade:02x}{shade:02x}{shade:02x}'
-            self.canvas.create_oval(self.center - r, self.center - r, self.center + r, self.center + r,
-                                    outline=color, width=1)
+            draw.ellipse((self.center - r, self.center - r, self.center + r, self.center + r),
+                         outline=(shade, shade, shade), width=1)
+        self.grid_layer = img
+        return img
 
     def draw_range_rings(self):
         """Отрисовка кругов дальности"""
-        num_rings = 4
-        for i in range(1, num_rings + 1):
-            range_val = (self.range_scale / num_rings) * i
-            radius = range_val * self.pixel_per_mile
-            self.canvas.create_oval(self.center - radius, self.center - radius,
-                                    self.center + radius, self.center + radius,
-                                    outline='#222222', width=1, dash=(3, 5))
-            x, y = self.polar_to_cartesian(0, range_val)
-            self.canvas.create_text(x + 8, y - 8, text=f"{int(range_val)}", fill='#666666', font=("Arial", 9))
+        for x1, y1, x2, y2, x_text, y_text, label in self.ring_geom:
+            self.canvas.create_oval(x1, y1, x2, y2,
+                                    outline='#222222', width=1, dash=(3, 5), tags=("static", "rings"))
+            self.canvas.create_text(x_text, y_text, text=label, fill='#666666', font=("Arial", 9),
+                                    tags=("static", "rings"))
 
     def draw_bearing_marks(self):
         """Отрисовка меток пеленга"""
-        for bearing in range(0, 360, 30):
-            x1, y1 = self.polar_to_cartesian(bearing, self.range_scale * 0.92)
-            x2, y2 = self.polar_to_cartesian(bearing, self.range_scale)
-            self.canvas.create_line(x1, y1, x2, y2, fill='#222222', width=1)
-            x_text, y_text = self.polar_to_cartesian(bearing, self.range_scale * 1.03)
-            self.canvas.create_text(x_text, y_text, text=f"{bearing}°", fill='#444444', font=("Arial", 9))
+        for x1, y1, x2, y2, x_text, y_text, label in self.bearing_geom:
+            self.canvas.create_line(x1, y1, x2, y2, fill='#222222', width=1, tags=("static", "bearings"))
+            self.canvas.create_text(x_text, y_text, text=label, fill='#444444', font=("Arial", 9),
+                                    tags=("static", "bearings"))
 
-    def draw_sea_clutter(self):
-        """Отрисовка морских помех"""
-        if self.clutter_intensity <= 0.01:
-            return
-        base_clusters = max(4, int(self.clutter_density * self.clutter_intensity / 40))
-        cluster_spread = max(0.5, self.range_scale * 0.25)
-        for _ in range(base_clusters):
-            cluster_bearing = random.uniform(0, 360)
-            cluster_range = random.uniform(1, self.range_scale * 0.9)
-            cluster_count = random.randint(8, 30)
-            for i in range(cluster_count):
-                b = cluster_bearing + random.uniform(-8, 8)
-                r = max(0.2, cluster_range + random.uniform(-cluster_spread*0.1, cluster_spread*0.1))
-                size = random.uniform(0.8, 4.0) * (1.0 + (self.clutter_intensity * 2.0))
-                brightness = self.calculate_clutter_brightness(random.uniform(0.05, 0.6) * self.clutter_intensity, r)
-                ci = int(255 * brightness)
-                color = f'#{ci:02x}{ci:02x}00'
-                x, y = self.polar_to_cartesian(b % 360, r)
-                w = max(1, int(size))
-                h = max(1, int(size * random.uniform(0.6, 1.4)))
-                self.canvas.create_oval(x - w, y - h, x + w, y + h, fill=color, outline='')
-
-        for _ in range(int(20 * self.clutter_intensity)):
-            b = random.uniform(0, 360)
-            r = random.uniform(0.2, self.range_scale * 0.9)
-            size = random.uniform(1.0, 3.5)
-            brightness = self.calculate_clutter_brightness(random.uniform(0.4, 0.9) * self.clutter_intensity, r)
-            ci = int(200 + 55 * brightness)
-            color = f'#{ci:02x}{ci:02x}00'
-            x, y = self.polar_to_cartesian(b, r)
-            self.canvas.create_oval(x - size, y - size, x + size, y + size, fill=color, outline='')
+    def clutter_cells(self):
+        """
+        Выборки морских помех для текущего зерна и шкалы дальности.
+        Геометрия генерируется один раз для максимальной интенсивности; интенсивность
+        лишь выбирает начальную часть выборок и масштабирует размер и яркость.
+        """
+        key = (self.clutter_seed, self.range_scale, self.clutter_density)
+        if self.clutter_cells_cache is not None and self.clutter_cells_cache[0] == key:
+            return self.clutter_cells_cache[1]
+        # Собственный генератор от зерна помех: картина помех не меняется
+        # при пересборке слоя (например, после изменения размера)
+        rng = np.random.default_rng(self.clutter_seed)
+        rs = self.range_scale
+        rs9 = rs * 0.9
+        spread10 = max(0.5, rs * 0.25) * 0.1
+        clusters = max(4, int(self.clutter_density / 40))
+
+        # Кластеры: параметры центра повторяются для каждой отметки кластера
+        counts = rng.integers(8, 31, size=clusters)
+        n = int(counts.sum())
+        b = np.repeat(rng.uniform(0, 360, clusters), counts) + rng.uniform(-8, 8, n)
+        r = np.repeat(rng.uniform(1, rs9, clusters), counts)
+        cells = {
+            'ends': np.cumsum(counts),  # число отметок в первых k кластерах
+            'b': b % 360,
+            'r': np.maximum(0.2, r + rng.uniform(-spread10, spread10, n)),
+            'size': rng.uniform(0.8, 4.0, n),
+            'aspect': rng.uniform(0.6, 1.4, n),
+            'base': rng.uniform(0.05, 0.6, n),
+            # Одиночные яркие отметки
+            'sb': rng.uniform(0, 360, 20),
+            'sr': rng.uniform(0.2, rs9, 20),
+            'ssize': rng.uniform(1.0, 3.5, 20),
+            'sbase': rng.uniform(0.4, 0.9, 20),
+        }
+        self.clutter_cells_cache = (key, cells)
+        return cells
+
+    def draw_sea_clutter(self, intensity, img):
+        """Растеризация морских помех в img: по готовым выборкам пересчитываются только размер и яркость"""
+        draw = ImageDraw.Draw(img)
+        cells = self.clutter_cells()
+        size_scale = 1.0 + (intensity * 2.0)
+        base_clusters = max(4, int(self.clutter_density * intensity / 40))
+        n = int(cells['ends'][min(base_clusters, len(cells['ends'])) - 1])
+        m = int(20 * intensity)
+
+        r = cells['r'][:n]
+        size = cells['size'][:n] * size_scale
+        brightness = self.calculate_clutter_brightness(cells['base'][:n] * intensity, r)
+        ci = (255 * brightness).astype(np.uint8)
+        w = np.maximum(1, size.astype(np.int32))
+        h = np.maximum(1, (size * cells['aspect'][:n]).astype(np.int32))
+
+        sr = cells['sr'][:m]
+        ssize = cells['ssize'][:m]
+        sbrightness = self.calculate_clutter_brightness(cells['sbase'][:m] * intensity, sr)
+        sci = (200 + 55 * sbrightness).astype(np.uint8)
+
+        b = np.concatenate((cells['b'][:n], cells['sb'][:m]))
+        r = np.concatenate((r, sr))
+        w = np.concatenate((w, ssize))
+        h = np.concatenate((h, ssize))
+        ci = np.concatenate((ci, sci))
+
+        # Во внутреннем цикле остается только вызов растеризатора:
+        # габариты считаются массивами, цвета берутся из готовой таблицы
+        xy = self.polar_to_xy_batch(b, r)
+        xs, ys = xy[0::2], xy[1::2]
+        boxes = np.column_stack((xs - w, ys - h, xs + w, ys + h)).tolist()
+        fills = CLUTTER_FILLS
+        ellipse = draw.ellipse
+        for box, c in zip(boxes, ci.tolist()):
+            ellipse(box, fill=fills[c])
 
     def draw_coastline(self):
         """Отрисовка береговой линии - теперь ближе к краю"""
-        if not self.coastline_points:
+        bearings, ranges = self.coastline_points
+        if len(bearings) < 2:
             return
-        pts = []
-        for b, r in self.coastline_points:
-            x, y = self.polar_to_cartesian(b, r)
-            pts.extend([x, y])
-        self.canvas.create_line(pts, fill='#CC9900', width=2, smooth=True)
-        for i in range(1, 4):
-            shade = int(200 - i*30)
-            shade = max(40, shade)
-            color = f'#{shade:02x}{int(shade*0.85):02x}30'
-            self.canvas.create_line(pts, fill=color, width=2 + i, smooth=True)
+        # Холст квадратный: центр и масштаб однозначно задаются его размером и шкалой дальности
+        key = (self.range_scale, self.canvas_size, id(self.coastline_points))
+        if self.coast_cache is None or self.coast_cache[0] != key:
+            self.coast_cache = (key, self.polar_to_xy_batch(bearings, ranges).tolist())
+        pts = self.coast_cache[1]
+        self.canvas.create_line(pts, fill='#CC9900', width=2, smooth=True, tags=("static", "coastline"))
+        for width, color in COASTLINE_GLOW:
+            self.canvas.create_line(pts, fill=color, width=width, smooth=True, tags=("static", "coastline"))
 
     def draw_target_trails(self):
         """Отрисовка следов цели - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
-        if len(self.target_history) < 2:
-            return
-        
-        # Рисуем соединительные линии между соседними точками
-        for i in range(len(self.target_history) - 1):
-            bearing1, range1, epr1 = self.target_history[i]
-            bearing2, range2, epr2 = self.target_history[i + 1]
-            
-            x1, y1 = self.polar_to_cartesian(bearing1, range1)
-            x2, y2 = self.polar_to_cartesian(bearing2, range2)
-            
-            # Плавное затухание
-            t = i / max(1, (len(self.target_history) - 2))
+        bearings, ranges, eprs = self.target_history.snapshot()
+        xy = self.polar_to_xy_batch(bearings, ranges)
+        coords = xy.tolist()
+        xs, ys = coords[0::2], coords[1::2]
+
+        # Соединительная линия: одна ломаная на каждую возрастную группу
+        # (ближние/средние/дальние отрезки) вместо отдельной линии на отрезок
+        segments = len(self.target_history) - 1
+        groups = min(self.trail_fade_groups, segments)
+        bounds = [round(k * segments / groups) for k in range(groups + 1)]
+        new_line = False
+        for k, (first, last) in enumerate(zip(bounds, bounds[1:])):
+            # Плавное затухание по среднему отрезку группы
+            t = (first + last - 1) / 2 / max(1, segments - 1)
             fade = 0.3 + 0.7 * (1.0 - t)
             alpha = int(255 * fade)
-            color = f'#00ff{alpha:02x}'
+            color = '#00ff' + HEX_BYTE[alpha]
             
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
+            # Элементы пула переиспользуются: меняются только координаты и цвет
+            line = coords[2 * first:2 * last + 2]
+            if k < len(self.trail_line_items):
+                item = self.trail_line_items[k]
+                self.canvas.coords(item, line)
+                self.canvas.itemconfigure(item, fill=color, state='normal')
+            else:
+                item = self.canvas.create_line(line, fill=color, width=2, tags=("trail", "trail_line"))
+                self.trail_line_items.append(item)
+                new_line = True
+        for item in self.trail_line_items[groups:self.trail_line_count]:
+            self.canvas.itemconfigure(item, state='hidden')
+        self.trail_line_count = groups
         
-        # Точки истории
-        for i, (bearing, range_val, epr) in enumerate(self.target_history):
-            t = i / max(1, (len(self.target_history) - 1))
-            fade = 0.4 + 0.6 * (1.0 - t)
-            
-            base_size = 3 + (epr * 0.5)
-            size = max(2, base_size * fade)
-            
-            r = int(100 + 155 * (1 - fade))
-            g = int(200 + 55 * fade)
-            b = int(50 * (1 - fade))
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            
-            x, y = self.polar_to_cartesian(bearing, range_val)
-            self.canvas.create_oval(x - size, y - size, x + size, y + size, 
-                                   fill=color, outline='')
+        # Точки истории: затухание и цвета берутся из таблицы для текущей длины следа
+        count = len(self.target_history)
+        fades, colors = trail_point_fades(count)
+        sizes = np.maximum(2, (3 + eprs * 0.5) * fades)
+        recolor = count != self.trail_point_count
+        pool = self.trail_point_items
+        for i, (x, y, size, color) in enumerate(zip(xs, ys, sizes.tolist(), colors)):
+            if i < len(pool):
+                self.canvas.coords(pool[i], x - size, y - size, x + size, y + size)
+                # Цвета точек зависят только от длины следа
+                if recolor:
+                    self.canvas.itemconfigure(pool[i], fill=color, state='normal')
+            else:
+                pool.append(self.canvas.create_oval(x - size, y - size, x + size, y + size,
+                                                    fill=color, outline='', tags=("trail", "trail_point")))
+        for item in pool[count:self.trail_point_count]:
+            self.canvas.itemconfigure(item, state='hidden')
+        self.trail_point_count = count
+
+        # Новый отрезок оказался бы поверх точек - возвращаем точки наверх
+        if new_line and pool:
+            self.canvas.tag_raise("trail_point", "trail_line")
+
+    def hide_target_trails(self):
+        """Скрытие следов цели без удаления элементов пула"""
+        if self.trail_line_count or self.trail_point_count:
+            self.canvas.itemconfigure("trail", state='hidden')
+            self.trail_line_count = 0
+            self.trail_point_count = 0
 
     def draw_target_cursor(self):
         """Отрисовка красного квадратного курсора вокруг цели (уменьшенный)"""
-        cx, cy = self.polar_to_cartesian(self.target_bearing, self.target_range)
+        cx, cy = self.target_position()
         cursor_size = 12  # Уменьшенный размер курсора
-        
-        # Рисуем красный квадрат
-        self.canvas.create_rectangle(
-            cx - cursor_size, cy - cursor_size,
-            cx + cursor_size, cy + cursor_size,
-            outline='red', width=2
-        )
-        
-        # Добавляем диагонали для лучшей видимости
-        self.canvas.create_line(
-            cx - cursor_size, cy - cursor_size,
-            cx + cursor_size, cy + cursor_size,
-            fill='red', width=1
-        )
-        self.canvas.create_line(
-            cx - cursor_size, cy + cursor_size,
-            cx + cursor_size, cy - cursor_size,
-            fill='red', width=1
-        )
+        x1, y1 = cx - cursor_size, cy - cursor_size
+        x2, y2 = cx + cursor_size, cy + cursor_size
+
+        if self.cursor_items is None:
+            self.cursor_items = (
+                # Красный квадрат
+                self.canvas.create_rectangle(x1, y1, x2, y2, outline='red', width=2, tags="cursor"),
+                # Диагонали для лучшей видимости
+                self.canvas.create_line(x1, y1, x2, y2, fill='red', width=1, tags="cursor"),
+                self.canvas.create_line(x1, y2, x2, y1, fill='red', width=1, tags="cursor"),
+            )
+        else:
+            rect, diagonal1, diagonal2 = self.cursor_items
+            self.canvas.coords(rect, x1, y1, x2, y2)
+            self.canvas.coords(diagonal1, x1, y1, x2, y2)
+            self.canvas.coords(diagonal2, x1, y2, x2, y1)
+            self.canvas.itemconfigure("cursor", state='normal')
+            self.canvas.tag_raise("cursor")
 
     def draw_target_form(self):
         """Отрисовка формуляра цели рядом с целью"""
-        cx, cy = self.polar_to_cartesian(self.target_bearing, self.target_range)
+        cx, cy = self.target_position()
         
         # Позиция формуляра (справа от цели, если помещается, иначе слева)
         form_x = cx + 15
@@ -593,11 +1005,14 @@ class ИКО:
         form_y = cy - 35
         
         # Фон формуляра
-        self.canvas.create_rectangle(
-            form_x, form_y,
-            form_x + form_width, form_y + 70,
-            fill='black', outline='white', width=1
-        )
+        if self.form_rect is None:
+            self.form_rect = self.canvas.create_rectangle(
+                form_x, form_y,
+                form_x + form_width, form_y + 70,
+                fill='black', outline='white', width=1, tags="form"
+            )
+        else:
+            self.canvas.coords(self.form_rect, form_x, form_y, form_x + form_width, form_y + 70)
         
         # Данные цели с выравниванием слева
         form_data = [
@@ -609,12 +1024,26 @@ class ИКО:
         ]
         
         # Текст формуляра зеленым цветом с выравниванием слева
-        for i, text in enumerate(form_data):
-            self.canvas.create_text(
-                form_x + 8, form_y + 12 + i * 14,
-                text=text, fill='#00FF00', font=("Arial", 10, "bold"),
-                anchor="w"  # Выравнивание по левому краю
-            )
+        # (строки создаются один раз, затем только перемещаются и переписываются)
+        if self.form_text_items is None:
+            self.form_text_items = [
+                self.canvas.create_text(
+                    form_x + 8, form_y + 12 + i * 14,
+                    text=text, fill='#00FF00', font=("Arial", 10, "bold"),
+                    anchor="w",  # Выравнивание по левому краю
+                    tags="form"
+                )
+                for i, text in enumerate(form_data)
+            ]
+            self.form_texts = form_data
+            return
+        for i, (item, text) in enumerate(zip(self.form_text_items, form_data)):
+            self.canvas.coords(item, form_x + 8, form_y + 12 + i * 14)
+            if text != self.form_texts[i]:
+                self.canvas.itemconfigure(item, text=text)
+        self.form_texts = form_data
+        self.canvas.itemconfigure("form", state='normal')
+        self.canvas.tag_raise("form")
 
     # ---------------- ВЫЧИСЛЕНИЯ ----------------
     def calculate_angular_width(self):
@@ -623,19 +1052,8 @@ class ИКО:
         projected = L * sin(aspect) + B * cos(aspect)
         Угол (рад) ~ projected / distance. Затем сжатие до реалистичных градусов РЛС.
         """
-        L = max(0.1, self.target_length)
-        B = max(0.1, self.target_width)
-        a_rad = math.radians(self.aspect_angle)
-        sin_a = abs(math.sin(a_rad))
-        cos_a = abs(math.cos(a_rad))
-        projected_m = L * sin_a + B * cos_a
-        distance_m = max(1.0, self.target_range * 1852.0)
-        angular_rad = projected_m / distance_m
-        angular_deg = math.degrees(angular_rad)
-        # сжатие до реалистичной отметки радара
-        angular_deg *= 0.3
-        angular_deg = max(0.18, min(3.5, angular_deg))
-        return angular_deg
+        return angular_width_kernel(self.target_length, self.target_width,
+                                    self.aspect_angle, self.target_range)
 
     def calculate_target_brightness(self):
         """
@@ -644,134 +1062,180 @@ class ИКО:
         - аспект -> sin(aspect)
         - затухание по дальности
         """
-        epr = max(0.01, self.target_epr)
-        epr_factor = math.log10(epr + 1)
-        aspect = max(0.0, min(1.0, abs(math.sin(math.radians(self.aspect_angle)))))
-        range_factor = 1.0 - (self.target_range / self.range_scale) * 0.6
-        range_factor = max(0.12, range_factor)
-        base = 0.12
-        brightness = base + epr_factor * aspect * range_factor * 1.5
-        brightness = max(0.05, min(1.0, brightness))
-        return brightness
+        return target_brightness_kernel(self.target_epr, self.aspect_angle,
+                                        self.target_range, self.range_scale)
 
     def calculate_clutter_brightness(self, base_intensity, range_val):
-        """Расчет яркости помех в зависимости от дальности"""
+        """Расчет яркости помех в зависимости от дальности (скаляры или массивы NumPy)"""
         max_clutter_brightness = 0.8
         range_factor = 1.0 - (range_val / self.range_scale) * 0.45
-        brightness = base_intensity * max_clutter_brightness * max(0.2, range_factor)
-        return max(0.05, min(max_clutter_brightness, brightness))
+        brightness = base_intensity * max_clutter_brightness * np.maximum(0.2, range_factor)
+        return np.clip(brightness, 0.05, max_clutter_brightness)
 
     # ---------------- Отрисовка текущей цели (исправленная) ----------------
     def draw_current_target(self):
         """Отрисовка текущей цели - исправленная версия без расщепления"""
-        # Вычисляем угловой размер и яркость
-        angular_width = self.calculate_angular_width()
+        # Цель за пределами развертки не видна: отметка скрывается без расчета яркости
+        if self.target_range >= self.range_scale:
+            if self.target_item is not None and not self.target_hidden:
+                self.canvas.itemconfigure(self.target_item, state='hidden')
+                self.target_hidden = True
+            return
+
+        # Вычисляем яркость
         brightness = self.calculate_target_brightness()
 
         # Главный цвет (желтый) масштабированный по яркости
         val = int(255 * max(0.15, min(1.0, brightness)))
-        main_color = f'#{val:02x}{val:02x}00'
 
         # Координаты центра цели
-        cx, cy = self.polar_to_cartesian(self.target_bearing, self.target_range)
+        cx, cy = self.target_position()
 
-        # Отрисовка основной отметки цели - ТОЛЬКО ТОЧКА
+        # Точка, ореол и внешний ореол (для больших целей) - одно готовое изображение
         core_r = max(3, int(3 + brightness * 4))  # Увеличенный размер точки
-        self.canvas.create_oval(cx - core_r, cy - core_r, cx + core_r, cy + core_r,
-                                fill=main_color, outline=main_color)
-
-        # Отрисовка ореола вокруг цели (небольшие круги)
-        halo_radius = core_r + 2
-        halo_color = f'#{min(255, val+50):02x}{min(255, val+30):02x}00'
-        self.canvas.create_oval(cx - halo_radius, cy - halo_radius, 
-                               cx + halo_radius, cy + halo_radius,
-                               outline=halo_color, width=1)
-
-        # Дополнительный внешний ореол для больших целей
-        if self.target_epr > 2.0:
-            outer_radius = halo_radius + 3
-            outer_color = f'#{min(255, val+20):02x}{min(255, val+10):02x}00'
-            self.canvas.create_oval(cx - outer_radius, cy - outer_radius, 
-                                   cx + outer_radius, cy + outer_radius,
-                                   outline=outer_color, width=1)
+        sprite = target_sprite(core_r, val, self.target_epr > 2.0)
+
+        # Элемент отметки создается один раз и затем только перемещается
+        if self.target_item is None:
+            self.target_item = self.canvas.create_image(cx, cy, image=sprite, tags="target")
+        else:
+            self.canvas.coords(self.target_item, cx, cy)
+            if sprite is not self.target_sprite:
+                self.canvas.itemconfigure(self.target_item, image=sprite)
+            if self.target_hidden:
+                self.canvas.itemconfigure(self.target_item, state='normal')
+                self.target_hidden = False
+            self.canvas.tag_raise(self.target_item)
+        self.target_sprite = sprite
 
     # ---------------- ОБРАБОТЧИКИ СОБЫТИЙ И УПРАВЛЕНИЕ ----------------
     def on_bearing_change(self, value):
         """Обработчик изменения пеленга"""
         self.target_bearing = float(value)
-        self.bearing_value_label.configure(text=f"{self.target_bearing:.0f}°")
+        self.queue_label_update(self.bearing_value_label, f"{self.target_bearing:.0f}°")
         self.add_to_history()
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_range_change(self, value):
         """Обработчик изменения дальности"""
         self.target_range = float(value)
-        self.range_value_label.configure(text=f"{self.target_range:.1f} миль")
+        self.queue_label_update(self.range_value_label, f"{self.target_range:.1f} миль")
         self.add_to_history()
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_aspect_change(self, value):
         """Обработчик изменения угла аспекта"""
         self.aspect_angle = float(value)
-        self.aspect_value_label.configure(text=f"{self.aspect_angle:.0f}°")
-        self.draw_radar_display()
+        self.queue_label_update(self.aspect_value_label, f"{self.aspect_angle:.0f}°")
+        self.schedule_redraw()
 
     def on_epr_change(self, value):
         """Обработчик изменения ЭПР"""
         self.target_epr = float(value)
-        self.epr_value_label.configure(text=f"{self.target_epr:.1f} м²")
+        self.queue_label_update(self.epr_value_label, f"{self.target_epr:.1f} м²")
         self.add_to_history()
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_clutter_change(self, value):
         """Обработчик изменения интенсивности помех"""
         self.clutter_intensity = float(value)
-        self.clutter_value_label.configure(text=f"{int(self.clutter_intensity*100)}%")
-        self.draw_radar_display()
+        self.queue_label_update(self.clutter_value_label, f"{int(self.clutter_intensity*100)}%")
+        # От помех зависит только кадр фона; draw_background() сменит его лишь при смене уровня
+        self.schedule_redraw(dynamic=False, background=True)
 
     def on_length_change(self, value):
         """Обработчик изменения длины цели"""
         self.target_length = float(value)
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_width_change(self, value):
         """Обработчик изменения ширины цели"""
         self.target_width = float(value)
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_trails_switch_change(self):
         """Обработчик переключения показа следов"""
         self.show_trails = (self.trails_switch_var.get() == "on")
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_trail_length_change(self, value):
         """Обработчик изменения длины следов"""
-        self.trail_length = int(value)
-        self.target_history = deque(maxlen=self.trail_length)
-        self.trail_length_label.configure(text=f"{self.trail_length}")
-        self.draw_radar_display()
+        # Во время перетаскивания ползунок присылает много событий с тем же целым значением
+        trail_length = int(value)
+        if trail_length == self.trail_length:
+            return
+        self.trail_length = trail_length
+        self.target_history.resize(self.trail_length)
+        if len(self.target_history) == 0:
+            self.last_hist_bearing = self.last_hist_range = math.nan
+        self.queue_label_update(self.trail_length_label, f"{self.trail_length}")
+        self.schedule_redraw()
 
     def on_coastline_switch_change(self):
         """Обработчик переключения показа береговой линии"""
         self.show_coastline = (self.coastline_switch_var.get() == "on")
-        self.draw_radar_display()
+        self.schedule_redraw(full=True)
 
     def on_form_switch_change(self):
         """Обработчик переключения показа формуляра цели"""
         self.show_target_form = (self.form_switch_var.get() == "on")
-        self.draw_radar_display()
+        self.schedule_redraw()
 
     def on_course_change(self, value):
         """Обработчик изменения курса цели"""
         self.target_course = float(value)
         self.target_course_current = self.target_course
-        self.course_label.configure(text=f"{self.target_course:.0f}°")
+        self.queue_label_update(self.course_label, f"{self.target_course:.0f}°")
+        self.schedule_redraw()
 
     def on_speed_change(self, value):
         """Обработчик изменения скорости цели"""
         self.target_speed = float(value)
         self.target_speed_current = self.target_speed
-        self.speed_label.configure(text=f"{self.target_speed:.1f} уз.")
+        self.queue_label_update(self.speed_label, f"{self.target_speed:.1f} уз.")
+        self.schedule_redraw()
+
+    def schedule_redraw(self, full=False, dynamic=True, background=False):
+        """Отложенная перерисовка: одна на итерацию цикла Tk и не чаще раза за redraw_interval мс"""
+        self.redraw_full = self.redraw_full or full
+        self.redraw_dynamic = self.redraw_dynamic or dynamic
+        self.redraw_background = self.redraw_background or background
+        if self.redraw_after_id is not None:
+            return
+        wait_ms = self.redraw_interval - (time.monotonic() - self.last_redraw_time) * 1000.0
+        if wait_ms > 0:
+            self.redraw_after_id = self.root.after(int(wait_ms) + 1, self.perform_redraw)
+        else:
+            # Прошлый кадр был давно: рисуем, как только Tk обработает текущие события
+            self.redraw_after_id = self.root.after_idle(self.perform_redraw)
+
+    def perform_redraw(self):
+        """Выполнение отложенной перерисовки"""
+        self.redraw_after_id = None
+        self.last_redraw_time = time.monotonic()
+        full, dynamic, background = self.redraw_full, self.redraw_dynamic, self.redraw_background
+        self.redraw_full = self.redraw_dynamic = self.redraw_background = False
+        if full:
+            self.draw_radar_display()
+            return
+        if background:
+            self.draw_background()
+        if dynamic:
+            self.draw_dynamic_layers()
+        else:
+            self.flush_label_updates()
+
+    def queue_label_update(self, label, text):
+        """Отложенная смена текста метки: применяется вместе с ближайшей отрисовкой цели"""
+        self.pending_labels[label] = text
+
+    def flush_label_updates(self):
+        """Применение накопленных текстов меток, по одному configure на метку"""
+        for label, text in self.pending_labels.items():
+            if self.label_texts.get(label) != text:
+                self.label_texts[label] = text
+                label.configure(text=text)
+        self.pending_labels.clear()
 
     def toggle_control_panel(self):
         """Сворачивание/разворачивание панели управления"""
@@ -790,15 +1254,14 @@ class ИКО:
 
     def add_to_history(self):
         """Добавление текущей позиции в историю"""
-        # Добавляем только если позиция значительно изменилась
-        if len(self.target_history) == 0:
-            self.target_history.appendleft((self.target_bearing, self.target_range, self.target_epr))
-        else:
-            last_bearing, last_range, last_epr = self.target_history[0]
-            # Добавляем только если изменение больше порога
-            if (abs(self.target_bearing - last_bearing) > 1.0 or 
-                abs(self.target_range - last_range) > 0.1):
-                self.target_history.appendleft((self.target_bearing, self.target_range, self.target_epr))
+        # Добавляем только если позиция значительно изменилась (больше порога);
+        # NaN в последней позиции означает пустую историю - первая точка добавляется всегда
+        db = self.target_bearing - self.last_hist_bearing
+        dr = self.target_range - self.last_hist_range
+        if db * db > 1.0 or dr * dr > 0.01 or self.last_hist_bearing != self.last_hist_bearing:
+            self.target_history.append(self.target_bearing, self.target_range, self.target_epr)
+            self.last_hist_bearing = self.target_bearing
+            self.last_hist_range = self.target_range
 
     def update_display(self):
         """Обновление дисплея"""
@@ -833,23 +1296,26 @@ class ИКО:
         self.length_var.set(self.target_length)
         self.width_var.set(self.target_width)
         self.aspect_var.set(self.aspect_angle)
-        self.bearing_value_label.configure(text=f"{self.target_bearing:.0f}°")
-        self.range_value_label.configure(text=f"{self.target_range:.1f} миль")
-        self.epr_value_label.configure(text=f"{self.target_epr:.1f} м²")
-        self.aspect_value_label.configure(text=f"{self.aspect_angle:.0f}°")
+        self.queue_label_update(self.bearing_value_label, f"{self.target_bearing:.0f}°")
+        self.queue_label_update(self.range_value_label, f"{self.target_range:.1f} миль")
+        self.queue_label_update(self.epr_value_label, f"{self.target_epr:.1f} м²")
+        self.queue_label_update(self.aspect_value_label, f"{self.aspect_angle:.0f}°")
         self.add_to_history()
-        self.draw_radar_display()
+        # Единственная отрисовка: set() у переменных не вызывает обработчики слайдеров
+        self.draw_dynamic_layers()
 
     def random_clutter(self):
         """Случайная настройка помех"""
-        self.clutter_intensity = random.uniform(0.05, 0.95)
+        self.clutter_intensity = float(self.rng.uniform(0.05, 0.95))
+        self.clutter_seed = int(self.rng.integers(2**32))
         self.clutter_var.set(self.clutter_intensity)
-        self.clutter_value_label.configure(text=f"{int(self.clutter_intensity*100)}%")
+        self.queue_label_update(self.clutter_value_label, f"{int(self.clutter_intensity*100)}%")
         self.draw_radar_display()
 
     def new_coastline(self):
         """Генерация новой береговой линии"""
         self.coastline_points = self.generate_coastline()
+        self.coast_cache = None
         self.draw_radar_display()
 
     # ---------------- ИМИТАЦИЯ ДВИЖЕНИЯ ЦЕЛИ ----------------
@@ -860,42 +1326,55 @@ class ИКО:
             self.target_course_current = self.target_course
             self.target_speed_current = self.target_speed
             self.info_var.set("Имитация движения запущена")
-            # Запускаем симуляцию
-            self.simulate_movement()
+            # Запускаем симуляцию: первый шаг через обычный интервал
+            self.last_tick_time = time.monotonic()
+            self.movement_after_id = self.root.after(self.simulation_interval, self.simulate_movement)
 
     def stop_movement(self):
         """Остановка имитации движения цели"""
         self.target_moving = False
+        if self.movement_after_id is not None:
+            self.root.after_cancel(self.movement_after_id)
+            self.movement_after_id = None
         self.info_var.set("Имитация движения остановлена")
 
     def simulate_movement(self):
         """Имитация движения цели по заданному курсу и скорости - ИСПРАВЛЕННАЯ ВЕРСИЯ"""
+        self.movement_after_id = None
         if not self.target_moving:
             return
 
+        sin, cos, atan2, sqrt = math.sin, math.cos, math.atan2, math.sqrt
         try:
             # Вычисляем новые координаты цели
             # 1 узел = 1 морская миля в час = 1/3600 миль в секунду
-            time_step = self.simulation_interval / 1000.0  # в секундах
+            # Шаг берется по фактически прошедшему времени: если тик задержался
+            # за событиями интерфейса, цель все равно проходит верное расстояние
+            now = time.monotonic()
+            time_step = now - self.last_tick_time  # в секундах
+            self.last_tick_time = now
             distance_moved = self.target_speed * time_step / 3600.0  # в милях
             
             # Преобразуем текущие полярные координаты в декартовы
             # Учитываем, что в полярных координатах:
             # x = range * sin(bearing), y = range * cos(bearing)
-            current_x = self.target_range * math.sin(math.radians(self.target_bearing))
-            current_y = self.target_range * math.cos(math.radians(self.target_bearing))
+            range_val = self.target_range
+            bearing_rad = self.target_bearing * DEG
+            current_x = range_val * sin(bearing_rad)
+            current_y = range_val * cos(bearing_rad)
             
             # Вычисляем смещение по курсу (курс измеряется от севера по часовой стрелке)
-            dx = distance_moved * math.sin(math.radians(self.target_course))
-            dy = distance_moved * math.cos(math.radians(self.target_course))
+            course_rad = self.target_course * DEG
+            dx = distance_moved * sin(course_rad)
+            dy = distance_moved * cos(course_rad)
             
             # Новые координаты
             new_x = current_x + dx
             new_y = current_y + dy
             
             # Преобразуем обратно в полярные координаты
-            new_range = math.sqrt(new_x**2 + new_y**2)
-            new_bearing = math.degrees(math.atan2(new_x, new_y)) % 360
+            new_range = sqrt(new_x * new_x + new_y * new_y)
+            new_bearing = (atan2(new_x, new_y) * RAD) % 360
             
             # Проверяем, не вышла ли цель за пределы радара
             if new_range >= self.range_scale - 0.5:
@@ -907,19 +1386,20 @@ class ИКО:
             self.target_range = new_range
             self.target_bearing = new_bearing
             
-            # Обновляем слайдеры и метки
-            self.range_var.set(self.target_range)
-            self.bearing_var.set(self.target_bearing)
-            self.range_value_label.configure(text=f"{self.target_range:.1f} миль")
-            self.bearing_value_label.configure(text=f"{self.target_bearing:.0f}°")
+            # Обновляем слайдеры и метки (set() у переменной двигает ползунок,
+            # но не вызывает command, поэтому обработчики on_*_change не срабатывают)
+            self.range_var.set(new_range)
+            self.bearing_var.set(new_bearing)
+            self.queue_label_update(self.range_value_label, f"{new_range:.1f} миль")
+            self.queue_label_update(self.bearing_value_label, f"{new_bearing:.0f}°")
             
             # Добавляем в историю и перерисовываем
             self.add_to_history()
-            self.draw_radar_display()
+            self.schedule_redraw()
             
             # Планируем следующий шаг
             if self.target_moving:
-                self.root.after(self.simulation_interval, self.simulate_movement)
+                self.movement_after_id = self.root.after(self.simulation_interval, self.simulate_movement)
                 
         except Exception as e:
             self.info_var.set(f"Ошибка имитации: {str(e)}")
@@ -927,43 +1407,61 @@ class ИКО:
 
     # ---------------- ПРОЦЕДУРНАЯ ГЕНЕРАЦИЯ БЕРЕГОВОЙ ЛИНИИ ----------------
     def generate_coastline(self):
-        """Генерация процедурной береговой линии - теперь ближе к краю"""
-        points = []
-        base_dir = (self.target_bearing + 120 + random.uniform(-20, 20)) % 360
+        """
+        Генерация процедурной береговой линии - теперь ближе к краю.
+        Возвращает пару массивов NumPy (пеленги, дальности).
+        """
+        base_dir = (self.target_bearing + 120 + self.rng.uniform(-20, 20)) % 360
         segments = 40
         
         # Берег теперь располагается ближе к краю развертки
         base_distance = self.range_scale * 0.75  # 75% от максимальной дальности
         
-        for i in range(segments):
-            angle = (base_dir - 60) + (i / (segments - 1)) * 120
-            # Увеличиваем амплитуду колебаний для более интересной формы берега
-            base_range = base_distance + math.sin(math.radians(i * 8 + random.uniform(-10, 10))) * (self.range_scale * 0.15)
-            jitter = random.uniform(-self.range_scale * 0.05, self.range_scale * 0.05)
-            r = max(self.range_scale * 0.5, min(self.range_scale - 1.0, base_range + jitter))
-            points.append((angle % 360, r))
-        
-        # Сглаживание береговой линии
-        smooth = []
-        for i in range(len(points)):
-            acc = 0.0
-            cnt = 0
-            for j in range(-2, 3):
-                ni = (i + j) % len(points)
-                acc += points[ni][1]
-                cnt += 1
-            avg = acc / cnt
-            smooth.append((points[i][0], avg))
-        return smooth
+        # Все сегменты синтезируются одним векторным расчетом
+        i = np.arange(segments)
+        angles = (base_dir - 60) + (i / (segments - 1)) * 120
+        # Увеличиваем амплитуду колебаний для более интересной формы берега
+        phase = self.rng.uniform(-10, 10, segments)
+        base_range = base_distance + np.sin(np.radians(i * 8 + phase)) * (self.range_scale * 0.15)
+        jitter = self.rng.uniform(-self.range_scale * 0.05, self.range_scale * 0.05, segments)
+        ranges = np.clip(base_range + jitter, self.range_scale * 0.5, self.range_scale - 1.0)
+        
+        # Сглаживание береговой линии: скользящее среднее по 5 точкам с циклическим дополнением
+        padded = np.concatenate((ranges[-2:], ranges, ranges[:2]))
+        smooth = np.convolve(padded, np.ones(5) / 5, mode='valid')
+        return angles % 360, smooth
 
     # ---------------- ОБРАБОТЧИКИ ИЗМЕНЕНИЯ РАЗМЕРА ----------------
     def on_resize(self, event):
         """Обработчик изменения размера холста"""
-        self.draw_radar_display()
+        # <Configure> приходит и при перемещении окна - размер при этом не меняется
+        size = (event.width, event.height)
+        if size == self.container_size:
+            return
+        self.container_size = size
+        self.schedule_resize()
 
     def on_root_configure(self, event):
         """Обработчик изменения размера окна"""
-        self.draw_radar_display()
+        # Привязка к окну верхнего уровня получает <Configure> всех дочерних виджетов
+        if event.widget is not self.root:
+            return
+        self.schedule_resize()
+
+    def schedule_resize(self):
+        """Отложенная перерисовка: серия событий <Configure> дает одну перерисовку"""
+        if self.resize_after_id is not None:
+            self.root.after_cancel(self.resize_after_id)
+        self.resize_after_id = self.root.after(self.resize_delay, self.perform_resize)
+
+    def perform_resize(self):
+        """Перерисовка после завершения изменения размера"""
+        self.resize_after_id = None
+        geometry_key = self.geometry_key
+        self.update_canvas_size()
+        # Размер холста ограничен сверху и снизу - перерисовка нужна, только если он изменился
+        if self.geometry_key != geometry_key:
+            self.schedule_redraw(full=True)
 
 
 # ---------------- ОСНОВНАЯ ПРОГРАММА ----------------